@@ -434,11 +434,8 @@ def historical_climate_qc(gdir):
 
     # Geometry data
     fls = gdir.read_pickle('inversion_flowlines')
-    heights = np.array([])
-    for fl in fls:
-        heights = np.append(heights, fl.surface_h)
-    top_h = np.max(heights)
-    bot_h = np.min(heights)
+    top_h = max(fl.surface_h.max() for fl in fls)
+    bot_h = min(fl.surface_h.min() for fl in fls)
 
     # First check - there should be at least one month of melt every year
     prev_ref_hgt = ref_hgt
@@ -567,17 +564,20 @@ def mb_climate_on_height(gdir, heights, *, time_range=None, year_range=None):
 
     # For each height pixel:
     # Compute temp and tempformelt (temperature above melting threshold)
-    npix = len(heights)
-    grad_temp = np.atleast_2d(igrad).repeat(npix, 0)
-    grad_temp *= (heights.repeat(len(time)).reshape(grad_temp.shape) - ref_hgt)
-    temp2d = np.atleast_2d(itemp).repeat(npix, 0) + grad_temp
-    temp2dformelt = temp2d - temp_melt
-    temp2dformelt = utils.clip_min(temp2dformelt, 0)
+    # The time series are broadcasted against the (npix, 1) heights and
+    # the operations are done in place, so that only the two output
+    # arrays of shape (npix, nt) are allocated
+    heights = np.asarray(heights, dtype=np.float64)[:, np.newaxis]
+    temp2d = np.multiply(heights - ref_hgt, igrad)
+    temp2d += itemp
+    temp2dformelt = np.subtract(temp2d, temp_melt)
+    utils.clip_min(temp2dformelt, 0, out=temp2dformelt)
     # Compute solid precipitation from total precipitation
-    prcpsol = np.atleast_2d(iprcp).repeat(npix, 0)
-    fac = 1 - (temp2d - temp_all_solid) / (temp_all_liq - temp_all_solid)
-    fac = utils.clip_array(fac, 0, 1)
-    prcpsol = prcpsol * fac
+    # (we don't need temp2d anymore and recycle it)
+    prcpsol = np.subtract(temp_all_liq, temp2d, out=temp2d)
+    prcpsol *= 1 / (temp_all_liq - temp_all_solid)
+    utils.clip_array(prcpsol, 0, 1, out=prcpsol)
+    prcpsol *= iprcp
 
     return time, temp2dformelt, prcpsol
 
@@ -623,20 +623,12 @@ def mb_yearly_climate_on_height(gdir, heights, *,
 
     if flatten:
         # Spatial average
-        temp_yr = np.zeros(len(years))
-        prcp_yr = np.zeros(len(years))
-        temp = np.mean(temp, axis=0)
-        prcp = np.mean(prcp, axis=0)
-        for i, y in enumerate(years):
-            temp_yr[i] = np.sum(temp[i*12:(i+1)*12])
-            prcp_yr[i] = np.sum(prcp[i*12:(i+1)*12])
+        temp_yr = np.mean(temp, axis=0).reshape((ny, 12)).sum(axis=1)
+        prcp_yr = np.mean(prcp, axis=0).reshape((ny, 12)).sum(axis=1)
     else:
         # Annual prcp and temp for each point (no spatial average)
-        temp_yr = np.zeros((len(heights), len(years)))
-        prcp_yr = np.zeros((len(heights), len(years)))
-        for i, y in enumerate(years):
-            temp_yr[:, i] = np.sum(temp[:, i*12:(i+1)*12], axis=1)
-            prcp_yr[:, i] = np.sum(prcp[:, i*12:(i+1)*12], axis=1)
+        temp_yr = temp.reshape((len(heights), ny, 12)).sum(axis=2)
+        prcp_yr = prcp.reshape((len(heights), ny, 12)).sum(axis=2)
 
     return years, temp_yr, prcp_yr
 
@@ -665,11 +657,8 @@ def mb_yearly_climate_on_glacier(gdir, *, year_range=None):
 
     flowlines = gdir.read_pickle('inversion_flowlines')
 
-    heights = np.array([])
-    widths = np.array([])
-    for fl in flowlines:
-        heights = np.append(heights, fl.surface_h)
-        widths = np.append(widths, fl.widths)
+    heights = np.concatenate([fl.surface_h for fl in flowlines])
+    widths = np.concatenate([fl.widths for fl in flowlines])
 
     years, temp, prcp = mb_yearly_climate_on_height(gdir, heights,
                                                     year_range=year_range,
@@ -1059,10 +1048,8 @@ def _check_terminus_mass_flux(gdir, fls, cmb):
 def _mu_star_per_minimization(x, fls, cmb, temp, prcp, widths):
 
     # Get the corresponding mu
-    mus = np.array([])
-    for fl in fls:
-        mu = fl.mu_star if fl.mu_star_is_valid else x
-        mus = np.append(mus, np.ones(fl.nx) * mu)
+    mus = np.concatenate([np.full(fl.nx, fl.mu_star if fl.mu_star_is_valid
+                                  else x) for fl in fls])
 
     # TODO: possible optimisation here
     out = np.average(prcp - mus[:, np.newaxis] * temp, axis=0, weights=widths)
@@ -1083,11 +1070,8 @@ def _recursive_mu_star_calibration(gdir, fls, t_star, first_call=True,
     yr_range = [t_star - mu_hp, t_star + mu_hp]
 
     # Get the corresponding mu
-    heights = np.array([])
-    widths = np.array([])
-    for fl in fls:
-        heights = np.append(heights, fl.surface_h)
-        widths = np.append(widths, fl.widths)
+    heights = np.concatenate([fl.surface_h for fl in fls])
+    widths = np.concatenate([fl.widths for fl in fls])
 
     _, temp, prcp = mb_yearly_climate_on_height(gdir, heights,
                                                 year_range=yr_range,
@@ -1,17 +1,28 @@
 """Mass-balance models"""
 # Built ins
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 # External libs
 import cftime
 import numpy as np
 import pandas as pd
 import netCDF4
-from scipy.interpolate import interp1d
 from scipy import optimize as optimization
+try:
+    from numba import njit
+    _have_numba = True
+except ImportError:
+    _have_numba = False
+try:
+    import numexpr as ne
+    _have_numexpr = True
+except ImportError:
+    _have_numexpr = False
 # Locals
 import oggm.cfg as cfg
 from oggm.cfg import SEC_IN_YEAR, SEC_IN_MONTH
-from oggm.utils import (SuperclassMeta, lazy_property, floatyear_to_date,
+from oggm.utils import (SuperclassMeta, floatyear_to_date,
                         date_to_floatyear, monthly_timeseries, ncDataset,
                         tolist, clip_min, clip_max, clip_array)
 from oggm.exceptions import InvalidWorkflowError, InvalidParamsError
@@ -21,6 +32,52 @@ from oggm import entity_task
 log = logging.getLogger(__name__)
 
 
+def _annual_mb_kernel(heights, itemp, iprcp, igrad, ref_hgt,
+                      t_solid, t_liq, t_melt, mu_star, out):
+    """Annual mass-balance (without bias) at the given heights.
+
+    This is the fused equivalent of the computations done in
+    ``PastMassBalance._get_2d_annual_climate``, compiled with numba if
+    available. The climate series are of shape (ny, 12) and ``out`` of
+    shape (npix, ny), in units of [mm w.e. yr-1]. The compiled kernel
+    releases the GIL, so that it can run concurrently in several threads
+    (see ``PastMassBalance.get_annual_mb_batch``). As in the NumPy code,
+    NaNs in the climate data propagate to the mass-balance.
+    """
+    inv_range = 1. / (t_liq - t_solid)
+    for i in range(heights.shape[0]):
+        dh = heights[i] - ref_hgt
+        for j in range(itemp.shape[0]):
+            s = 0.
+            for m in range(itemp.shape[1]):
+                t = itemp[j, m] + igrad[j, m] * dh
+                tm = t - t_melt
+                if tm < 0:
+                    tm = 0.
+                f = (t_liq - t) * inv_range
+                if f < 0:
+                    f = 0.
+                elif f > 1:
+                    f = 1.
+                s += iprcp[j, m] * f - mu_star * tm
+            out[i, j] = s
+    return out
+
+
+if _have_numba:
+    # All fast-math flags except nnan and ninf, which would make NaNs
+    # undefined behaviour
+    _annual_mb_kernel = njit(nogil=True, cache=True,
+                             fastmath={'reassoc', 'contract', 'arcp', 'nsz',
+                                       'afn'})(_annual_mb_kernel)
+
+# The monthly MB (without bias) for numexpr, where t is the temperature
+# at the given heights
+_NE_MONTHLY_MB = ('iprcp * where(t >= t_liq, 0, where(t <= t_solid, 1, '
+                  '(t_liq - t) * inv_range)) - '
+                  'mu_star * where(t < t_melt, 0, t - t_melt)')
+
+
 class MassBalanceModel(object, metaclass=SuperclassMeta):
     """Interface and common logic for all mass balance models used in OGGM.
 
@@ -155,24 +212,30 @@ class MassBalanceModel(object, metaclass=SuperclassMeta):
             return np.asarray(out)
 
         if fls is not None:
-            mbs = []
-            widths = []
-            for i, fl in enumerate(fls):
-                _widths = fl.widths
-                try:
-                    # For rect and parabola don't compute spec mb
-                    _widths = np.where(fl.thick > 0, _widths, 0)
-                except AttributeError:
-                    pass
-                widths = np.append(widths, _widths)
-                mbs = np.append(mbs, self.get_annual_mb(fl.surface_h,
-                                                        fls=fls, fl_id=i,
-                                                        year=year))
+            mbs = [self.get_annual_mb(fl.surface_h, fls=fls, fl_id=i,
+                                      year=year)
+                   for i, fl in enumerate(fls)]
+            mbs = np.concatenate(mbs)
+            widths = self._get_fls_widths(fls)
         else:
             mbs = self.get_annual_mb(heights, year=year)
 
         return np.average(mbs, weights=widths) * SEC_IN_YEAR * self.rho
 
+    @staticmethod
+    def _get_fls_widths(fls):
+        # The widths of all flowlines, as weights for the specific MB
+        widths = []
+        for fl in fls:
+            _widths = fl.widths
+            try:
+                # For rect and parabola don't compute spec mb
+                _widths = np.where(fl.thick > 0, _widths, 0)
+            except AttributeError:
+                pass
+            widths.append(_widths)
+        return np.concatenate(widths)
+
     def get_ela(self, year=None, **kwargs):
         """Compute the equilibrium line altitude for this year
 
@@ -409,8 +472,12 @@ class PastMassBalance(MassBalanceModel):
                                              time[-1].year+1), 12)
             self.months = np.tile(np.arange(1, 13), ny)
             # Read timeseries and correct it
-            self.temp = nc.variables['temp'][:].astype(np.float64) + self._temp_bias
-            self.prcp = nc.variables['prcp'][:].astype(np.float64) * self._prcp_fac
+            # The original series are kept so that the biases are always
+            # applied to them (and not cumulatively)
+            self._temp_orig = nc.variables['temp'][:].astype(np.float64)
+            self._prcp_orig = nc.variables['prcp'][:].astype(np.float64)
+            self.temp = self._temp_orig + self._temp_bias
+            self.prcp = self._prcp_orig * self._prcp_fac
             if 'gradient' in nc.variables:
                 grad = nc.variables['gradient'][:].astype(np.float64)
                 # Security for stuff that can happen with local gradients
@@ -424,6 +491,12 @@ class PastMassBalance(MassBalanceModel):
             self.ys = self.years[0] if ys is None else ys
             self.ye = self.years[-1] if ye is None else ye
 
+        # (ny, 12) views on the series for the annual computations. These
+        # share memory with the series, which are always updated in place
+        self._temp_my = self.temp.reshape((ny, 12))
+        self._prcp_my = self.prcp.reshape((ny, 12))
+        self._grad_my = self.grad.reshape((ny, 12))
+
     # adds the possibility of changing prcp_fac
     # after instantiation with properly changing the prcp time series
     @property
@@ -443,7 +516,7 @@ class PastMassBalance(MassBalanceModel):
             new_prcp_fac = np.roll(new_prcp_fac, 13 - sm)
             new_prcp_fac = np.tile(new_prcp_fac, len(self.prcp) // 12)
 
-        self.prcp *= new_prcp_fac / self._prcp_fac
+        np.multiply(self._prcp_orig, new_prcp_fac, out=self.prcp)
 
         # update old prcp_fac in order that it can be updated again ...
         self._prcp_fac = new_prcp_fac
@@ -463,7 +536,7 @@ class PastMassBalance(MassBalanceModel):
             new_temp_bias = np.roll(new_temp_bias, 13 - sm)
             new_temp_bias = np.tile(new_temp_bias, len(self.temp) // 12)
 
-        self.temp += new_temp_bias - self._temp_bias
+        np.add(self._temp_orig, new_temp_bias, out=self.temp)
 
         # update old temp_bias in order that it can be updated again ...
         self._temp_bias = new_temp_bias
@@ -485,7 +558,11 @@ class PastMassBalance(MassBalanceModel):
         if y < self.ys or y > self.ye:
             raise ValueError('year {} out of the valid time bounds: '
                              '[{}, {}]'.format(y, self.ys, self.ye))
-        pok = np.where((self.years == y) & (self.months == m))[0][0]
+        # The series are contiguous monthly data starting with month 1 of
+        # the first year
+        pok = int(y - self.years[0]) * 12 + m - 1
+        if pok < 0 or pok >= len(self.years):
+            raise ValueError('Year {} not in record'.format(int(y)))
 
         # Read already (temperature bias and precipitation factor corrected!)
         itemp = self.temp[pok]
@@ -494,50 +571,55 @@ class PastMassBalance(MassBalanceModel):
 
         # For each height pixel:
         # Compute temp and tempformelt (temperature above melting threshold)
+        # The heights are expanded in place, without intermediate arrays
         npix = len(heights)
-        temp = np.ones(npix) * itemp + igrad * (heights - self.ref_hgt)
+        temp = np.subtract(heights, self.ref_hgt, dtype=np.float64)
+        temp *= igrad
+        temp += itemp
         tempformelt = temp - self.t_melt
         clip_min(tempformelt, 0, out=tempformelt)
 
         # Compute solid precipitation from total precipitation
-        prcp = np.ones(npix) * iprcp
-        fac = 1 - (temp - self.t_solid) / (self.t_liq - self.t_solid)
+        prcp = np.full(npix, iprcp, dtype=np.float64)
+        fac = (self.t_liq - temp) * (1 / (self.t_liq - self.t_solid))
         prcpsol = prcp * clip_array(fac, 0, 1)
 
         return temp, tempformelt, prcp, prcpsol
 
-    def _get_2d_annual_climate(self, heights, year):
-        # Avoid code duplication with a getter routine
+    def _get_annual_tseries(self, year):
+        # The 12 monthly values of the climate time series for this year
         year = np.floor(year)
         if self.repeat:
             year = self.ys + (year - self.ys) % (self.ye - self.ys + 1)
         if year < self.ys or year > self.ye:
             raise ValueError('year {} out of the valid time bounds: '
                              '[{}, {}]'.format(year, self.ys, self.ye))
-        pok = np.where(self.years == year)[0]
-        if len(pok) < 1:
+        # The series are contiguous monthly data starting with the first year
+        pok = int(year - self.years[0])
+        if pok < 0 or pok >= len(self._temp_my):
             raise ValueError('Year {} not in record'.format(int(year)))
 
         # Read already (temperature bias and precipitation factor corrected!)
-        itemp = self.temp[pok]
-        iprcp = self.prcp[pok]
-        igrad = self.grad[pok]
+        return self._temp_my[pok], self._prcp_my[pok], self._grad_my[pok]
+
+    def _get_2d_annual_climate(self, heights, year):
+        # Avoid code duplication with a getter routine
+        itemp, iprcp, igrad = self._get_annual_tseries(year)
 
         # For each height pixel:
         # Compute temp and tempformelt (temperature above melting threshold)
-        heights = np.asarray(heights)
-        npix = len(heights)
-        grad_temp = np.atleast_2d(igrad).repeat(npix, 0)
-        grad_temp *= (heights.repeat(12).reshape(grad_temp.shape) -
-                      self.ref_hgt)
-        temp2d = np.atleast_2d(itemp).repeat(npix, 0) + grad_temp
+        # The (12,) monthly series are broadcasted against the (npix, 1)
+        # heights: this avoids building and traversing repeated arrays
+        heights = np.asarray(heights, dtype=np.float64)[:, np.newaxis]
+        temp2d = itemp + igrad * (heights - self.ref_hgt)
         temp2dformelt = temp2d - self.t_melt
         clip_min(temp2dformelt, 0, out=temp2dformelt)
 
         # Compute solid precipitation from total precipitation
-        prcp = np.atleast_2d(iprcp).repeat(npix, 0)
-        fac = 1 - (temp2d - self.t_solid) / (self.t_liq - self.t_solid)
-        prcpsol = prcp * clip_array(fac, 0, 1)
+        prcp = np.broadcast_to(iprcp, temp2d.shape)
+        fac = clip_array((self.t_liq - temp2d) *
+                         (1 / (self.t_liq - self.t_solid)), 0, 1)
+        prcpsol = iprcp * fac
 
         return temp2d, temp2dformelt, prcp, prcpsol
 
@@ -560,28 +642,175 @@ class PastMassBalance(MassBalanceModel):
         t, tmelt, prcp, prcpsol = self.get_monthly_climate(heights, year=year)
         mb_month = prcpsol - self.mu_star * tmelt
         mb_month -= self.bias * SEC_IN_MONTH / SEC_IN_YEAR
+        mb_month *= 1 / (SEC_IN_MONTH * self.rho)
         if add_climate:
-            return (mb_month / SEC_IN_MONTH / self.rho, t, tmelt,
-                    prcp, prcpsol)
-        return mb_month / SEC_IN_MONTH / self.rho
+            return mb_month, t, tmelt, prcp, prcpsol
+        return mb_month
 
     def get_annual_mb(self, heights, year=None, add_climate=False, **kwargs):
 
+        if _have_numba and not add_climate:
+            # Fast path: no need for the intermediate climate arrays
+            itemp, iprcp, igrad = self._get_annual_tseries(year)
+            heights = np.asarray(heights, dtype=np.float64)
+            mb_annual = _annual_mb_kernel(heights, itemp[np.newaxis],
+                                          iprcp[np.newaxis],
+                                          igrad[np.newaxis],
+                                          self.ref_hgt, self.t_solid,
+                                          self.t_liq, self.t_melt,
+                                          self.mu_star,
+                                          np.empty((len(heights), 1)))[:, 0]
+            return (mb_annual - self.bias) * (1 / (SEC_IN_YEAR * self.rho))
+
         t, tmelt, prcp, prcpsol = self._get_2d_annual_climate(heights, year)
         mb_annual = np.sum(prcpsol - self.mu_star * tmelt, axis=1)
-        mb_annual = (mb_annual - self.bias) / SEC_IN_YEAR / self.rho
+        mb_annual = (mb_annual - self.bias) * (1 / (SEC_IN_YEAR * self.rho))
         if add_climate:
             return (mb_annual, t.mean(axis=1), tmelt.sum(axis=1),
                     prcp.sum(axis=1), prcpsol.sum(axis=1))
         return mb_annual
 
+    def get_annual_mb_multiyear(self, heights, years):
+        """Like `self.get_annual_mb()`, but for several years at once.
+
+        Units: [m s-1], or meters of ice per second
+
+        Parameters
+        ----------
+        heights: ndarray
+            the altitudes at which the mass-balance will be computed
+        years: array of floats
+            the years (in the "hydrological floating year" convention)
+
+        Returns
+        -------
+        the mass-balance of shape (len(heights), len(years)) (units: [m s-1])
+        """
+
+        years = np.floor(np.atleast_1d(years))
+        if self.repeat:
+            years = self.ys + (years - self.ys) % (self.ye - self.ys + 1)
+        if np.any(years < self.ys) or np.any(years > self.ye):
+            raise ValueError('years out of the valid time bounds: '
+                             '[{}, {}]'.format(self.ys, self.ye))
+        pok = (years - self.years[0]).astype(int)
+        notok = (pok < 0) | (pok >= len(self._temp_my))
+        if np.any(notok):
+            raise ValueError('Years {} not in record'.format(years[notok]))
+
+        # (ny, 12) arrays of the climate series for these years
+        itemp = self._temp_my[pok]
+        iprcp = self._prcp_my[pok]
+        igrad = self._grad_my[pok]
+
+        heights = np.asarray(heights, dtype=np.float64)
+        if _have_numba:
+            mb_annual = _annual_mb_kernel(heights, itemp, iprcp, igrad,
+                                          self.ref_hgt, self.t_solid,
+                                          self.t_liq, self.t_melt,
+                                          self.mu_star,
+                                          np.empty((len(heights),
+                                                    len(years))))
+        elif _have_numexpr:
+            # numexpr fuses the element-wise operations on the potentially
+            # large (npix, ny, 12) arrays and computes them in parallel
+            dh = heights[:, np.newaxis, np.newaxis] - self.ref_hgt
+            temp3d = ne.evaluate('itemp + igrad * dh')
+            inv_range = 1 / float(self.t_liq - self.t_solid)
+            mb3d = ne.evaluate(_NE_MONTHLY_MB,
+                               local_dict={'t': temp3d,
+                                           'iprcp': iprcp,
+                                           't_liq': float(self.t_liq),
+                                           't_solid': float(self.t_solid),
+                                           'inv_range': inv_range,
+                                           't_melt': float(self.t_melt),
+                                           'mu_star': float(self.mu_star)})
+            mb_annual = np.sum(mb3d, axis=2)
+        else:
+            # (npix, ny, 12) arrays, reduced over the months. The
+            # temperature isn't needed afterwards: work in place
+            temp3d = itemp + igrad * (heights[:, np.newaxis, np.newaxis] -
+                                      self.ref_hgt)
+            fac = np.subtract(self.t_liq, temp3d)
+            fac *= 1 / (self.t_liq - self.t_solid)
+            clip_array(fac, 0, 1, out=fac)
+            tmelt = np.subtract(temp3d, self.t_melt, out=temp3d)
+            clip_min(tmelt, 0, out=tmelt)
+            fac *= iprcp
+            tmelt *= self.mu_star
+            mb_annual = np.sum(np.subtract(fac, tmelt, out=fac), axis=2)
+
+        return (mb_annual - self.bias) * (1 / (SEC_IN_YEAR * self.rho))
+
+    def get_annual_mb_batch(self, heights, years, max_workers=None):
+        """Like `self.get_annual_mb()`, for many (heights, year) pairs.
+
+        The computations are distributed over a pool of threads. This only
+        scales if the mass-balance kernel releases the GIL, i.e. if numba
+        is installed.
+
+        Units: [m s-1], or meters of ice per second
+
+        Parameters
+        ----------
+        heights: list of ndarrays
+            the altitudes at which the mass-balance will be computed
+        years: list of floats
+            the years (in the "hydrological floating year" convention),
+            one for each element of `heights`
+        max_workers: int, optional
+            the number of threads to use. The default is to use one thread
+            if OGGM's multiprocessing is switched on (to not oversubscribe
+            the processors), and the ThreadPoolExecutor default otherwise.
+
+        Returns
+        -------
+        the list of mass-balance arrays (units: [m s-1])
+        """
+
+        if len(heights) != len(years):
+            raise ValueError('heights and years should have the same length')
+        if max_workers is None and cfg.PARAMS['use_multiprocessing']:
+            max_workers = 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_annual_mb, heights, years))
+
+    def get_specific_mb(self, heights=None, widths=None, fls=None,
+                        year=None):
+
+        if len(np.atleast_1d(year)) == 1:
+            return super(PastMassBalance, self).get_specific_mb(
+                heights=heights, widths=widths, fls=fls, year=year)
+
+        if fls is not None:
+            heights = np.concatenate([fl.surface_h for fl in fls])
+            widths = self._get_fls_widths(fls)
+
+        # All years at once
+        mbs = self.get_annual_mb_multiyear(heights, year)
+        return np.average(mbs, axis=0, weights=widths) * SEC_IN_YEAR * self.rho
+
 
 class ConstantMassBalance(MassBalanceModel):
     """Constant mass-balance during a chosen period.
 
     This is useful for equilibrium experiments.
+
+    The MB lookup tables are kept for the last few values of ``temp_bias``,
+    ``prcp_fac`` and ``mu_star``, so that going back to previous values (as
+    done by e.g. UncertainMassBalance or by bias optimisations) does not
+    require to compute them again. The biases are binned at the resolution
+    given by ``_bias_resolution``: two values closer than that share the
+    same lookup tables. The tables do not include the residual ``bias``,
+    which is applied afterwards.
     """
 
+    # Resolution (degC for temp_bias, unitless for prcp_fac) at which the
+    # lookup tables are recycled
+    _bias_resolution = 1e-4
+    # Number of sets of lookup tables to keep
+    _interp_maxsize = 8
+
     def __init__(self, gdir, mu_star=None, bias=None,
                  y0=None, halfsize=15, filename='climate_historical',
                  input_filesuffix='', **kwargs):
@@ -622,12 +851,10 @@ class ConstantMassBalance(MassBalanceModel):
         # This is a quick'n dirty optimisation
         try:
             fls = gdir.read_pickle('model_flowlines')
-            h = []
-            for fl in fls:
-                # We use bed because of overdeepenings
-                h = np.append(h, fl.bed_h)
-                h = np.append(h, fl.surface_h)
-            zminmax = np.round([np.min(h)-50, np.max(h)+2000])
+            # We use bed because of overdeepenings
+            hmin = min(min(fl.bed_h.min(), fl.surface_h.min()) for fl in fls)
+            hmax = max(max(fl.bed_h.max(), fl.surface_h.max()) for fl in fls)
+            zminmax = np.round([hmin-50, hmax+2000])
         except FileNotFoundError:
             # in case we don't have them
             with ncDataset(gdir.get_filepath('gridded_data')) as nc:
@@ -643,6 +870,10 @@ class ConstantMassBalance(MassBalanceModel):
         self.years = np.arange(y0-halfsize, y0+halfsize+1)
         self.hemisphere = gdir.hemisphere
 
+        # Lookup tables, see _get_interp_tables
+        self._interp = OrderedDict()
+        self._set_interp_key()
+
     @property
     def temp_bias(self):
         """Temperature bias to add to the original series."""
@@ -651,10 +882,8 @@ class ConstantMassBalance(MassBalanceModel):
     @temp_bias.setter
     def temp_bias(self, value):
         """Temperature bias to add to the original series."""
-        for attr_name in ['_lazy_interp_yr', '_lazy_interp_m']:
-            if hasattr(self, attr_name):
-                delattr(self, attr_name)
         self.mbmod.temp_bias = value
+        self._set_interp_key()
 
     @property
     def prcp_fac(self):
@@ -664,10 +893,8 @@ class ConstantMassBalance(MassBalanceModel):
     @prcp_fac.setter
     def prcp_fac(self, value):
         """Precipitation factor to apply to the original series."""
-        for attr_name in ['_lazy_interp_yr', '_lazy_interp_m']:
-            if hasattr(self, attr_name):
-                delattr(self, attr_name)
         self.mbmod.prcp_fac = value
+        self._set_interp_key()
 
     @property
     def bias(self):
@@ -679,26 +906,63 @@ class ConstantMassBalance(MassBalanceModel):
         """Residual bias to apply to the original series."""
         self.mbmod.bias = value
 
-    @lazy_property
+    def _set_interp_key(self):
+        # The (binned) temp_bias and prcp_fac the lookup tables depend on.
+        # They can be scalars or arrays (monthly values)
+        res = self._bias_resolution
+        self._interp_key = tuple(np.round(np.atleast_1d(v) / res)
+                                 .astype(np.int64).tobytes()
+                                 for v in (self.temp_bias, self.prcp_fac))
+
+    def _get_interp_tables(self):
+        # The lookup tables for the current parameters, in a small least
+        # recently used cache
+        key = self._interp_key, self.mbmod.mu_star
+        tables = self._interp.get(key)
+        if tables is None:
+            tables = self._interp[key] = dict()
+            if len(self._interp) > self._interp_maxsize:
+                self._interp.popitem(last=False)
+        else:
+            self._interp.move_to_end(key)
+        return tables
+
+    def _make_interp(self, mb_on_h):
+        # We store the (xp, fp) lookup table and use np.interp, which is
+        # much faster than scipy's interp1d for this simple 1D case. The
+        # residual bias is removed from the table (see _get_bias)
+        return self.hbins, mb_on_h / len(self.years) + self._get_bias()
+
+    def _get_bias(self):
+        # The residual bias in [m s-1] (same for annual and monthly MB)
+        return self.mbmod.bias * (1 / (SEC_IN_YEAR * self.mbmod.rho))
+
+    @property
     def interp_yr(self):
-        # annual MB
-        mb_on_h = self.hbins*0.
-        for yr in self.years:
-            mb_on_h += self.mbmod.get_annual_mb(self.hbins, year=yr)
-        return interp1d(self.hbins, mb_on_h / len(self.years))
+        # annual MB (without residual bias)
+        tables = self._get_interp_tables()
+        if 'annual' not in tables:
+            mb_on_h = self.hbins*0.
+            for yr in self.years:
+                mb_on_h += self.mbmod.get_annual_mb(self.hbins, year=yr)
+            tables['annual'] = self._make_interp(mb_on_h)
+        return tables['annual']
 
-    @lazy_property
+    @property
     def interp_m(self):
-        # monthly MB
-        months = np.arange(12)+1
-        interp_m = []
-        for m in months:
+        # monthly MB (without residual bias), one lookup table per month
+        # which is only computed when needed (see _get_interp_m)
+        return [self._get_interp_m(m) for m in np.arange(12)+1]
+
+    def _get_interp_m(self, m):
+        tables = self._get_interp_tables()
+        if m not in tables:
             mb_on_h = self.hbins*0.
             for yr in self.years:
                 yr = date_to_floatyear(yr, m)
                 mb_on_h += self.mbmod.get_monthly_mb(self.hbins, year=yr)
-            interp_m.append(interp1d(self.hbins, mb_on_h / len(self.years)))
-        return interp_m
+            tables[m] = self._make_interp(mb_on_h)
+        return tables[m]
 
     def get_monthly_climate(self, heights, year=None):
         """Average climate information at given heights.
@@ -766,11 +1030,16 @@ class ConstantMassBalance(MassBalanceModel):
         yr, m = floatyear_to_date(year)
         if add_climate:
             t, tmelt, prcp, prcpsol = self.get_monthly_climate(heights, year=year)
-            return self.interp_m[m-1](heights), t, tmelt, prcp, prcpsol
-        return self.interp_m[m-1](heights)
+            mb = np.interp(heights, *self._get_interp_m(m))
+            mb -= self._get_bias()
+            return mb, t, tmelt, prcp, prcpsol
+        mb = np.interp(heights, *self._get_interp_m(m))
+        mb -= self._get_bias()
+        return mb
 
     def get_annual_mb(self, heights, year=None, add_climate=False, **kwargs):
-        mb = self.interp_yr(heights)
+        mb = np.interp(heights, *self.interp_yr)
+        mb -= self._get_bias()
         if add_climate:
             t, tmelt, prcp, prcpsol = self.get_annual_climate(heights)
             return mb, t, tmelt, prcp, prcpsol
@@ -1221,11 +1490,12 @@ class MultipleFlowlineMassBalance(MassBalanceModel):
         mbs = []
         for i, fl in enumerate(fls):
             h = fl.surface_h
-            heights = np.append(heights, h)
-            widths = np.append(widths, fl.widths)
-            mbs = np.append(mbs, self.get_annual_mb(h, year=year, fl_id=i))
+            heights.append(h)
+            widths.append(fl.widths)
+            mbs.append(self.get_annual_mb(h, year=year, fl_id=i))
 
-        return heights, widths, mbs
+        return (np.concatenate(heights), np.concatenate(widths),
+                np.concatenate(mbs))
 
     def get_specific_mb(self, heights=None, widths=None, fls=None,
                         year=None):
@@ -1250,11 +1520,11 @@ class MultipleFlowlineMassBalance(MassBalanceModel):
                 _widths = np.where(fl.thick > 0, _widths, 0)
             except AttributeError:
                 pass
-            widths = np.append(widths, _widths)
+            widths.append(_widths)
             mb = mb_mod.get_annual_mb(fl.surface_h, year=year, fls=fls, fl_id=i)
-            mbs = np.append(mbs, mb * SEC_IN_YEAR * mb_mod.rho)
+            mbs.append(mb * SEC_IN_YEAR * mb_mod.rho)
 
-        return np.average(mbs, weights=widths)
+        return np.average(np.concatenate(mbs), weights=np.concatenate(widths))
 
     def get_ela(self, year=None, **kwargs):
 
@@ -255,6 +255,11 @@ class TestMassBalanceModels:
                                                       year_range=yrp)
 
         mb_mod = massbalance.PastMassBalance(gdir, bias=0)
+        # Plain contiguous arrays, not masked arrays
+        for ts in [mb_mod.temp, mb_mod.prcp, mb_mod.grad]:
+            assert not np.ma.isMaskedArray(ts)
+            assert ts.dtype == np.float64
+            assert ts.flags['C_CONTIGUOUS']
         for i, yr in enumerate(np.arange(yrp[0], yrp[1]+1)):
             ref_mb_on_h = p[:, i] - mu_star * t[:, i]
             my_mb_on_h = mb_mod.get_annual_mb(h, yr) * F
@@ -354,6 +359,81 @@ class TestMassBalanceModels:
                                                     years=mbdf.index.values)
         assert_allclose(s, mbdf['MY_MB'])
 
+    def test_past_mb_numba_kernel(self, hef_gdir, monkeypatch):
+
+        pytest.importorskip('numba')
+
+        h, w = hef_gdir.get_inversion_flowline_hw()
+        mb_mod = massbalance.PastMassBalance(hef_gdir)
+        yrs = np.arange(1851, 2001)
+
+        ref = [mb_mod.get_annual_mb(h, yr, add_climate=True)[0]
+               for yr in yrs]
+        for yr, ref_mb in zip(yrs, ref):
+            assert_allclose(mb_mod.get_annual_mb(h, yr), ref_mb, rtol=1e-7)
+
+        # Same without numba
+        monkeypatch.setattr(massbalance, '_have_numba', False)
+        for yr, ref_mb in zip(yrs, ref):
+            assert_allclose(mb_mod.get_annual_mb(h, yr), ref_mb)
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_past_mb_nan_climate(self, hef_gdir, monkeypatch, use_numba):
+
+        if use_numba:
+            pytest.importorskip('numba')
+        else:
+            monkeypatch.setattr(massbalance, '_have_numba', False)
+
+        h, w = hef_gdir.get_inversion_flowline_hw()
+        mb_mod = massbalance.PastMassBalance(hef_gdir)
+        # One invalid month in 1950
+        mb_mod.temp[np.nonzero(mb_mod.years == 1950)[0][5]] = np.NaN
+
+        assert np.all(np.isnan(mb_mod.get_annual_mb(h, 1950)))
+        assert np.all(np.isnan(mb_mod.get_annual_mb_multiyear(h, [1950])))
+        assert np.isnan(mb_mod.get_ela(1950))
+        assert np.all(np.isfinite(mb_mod.get_annual_mb(h, 1951)))
+
+    def test_past_mb_multiyear(self, hef_gdir, monkeypatch):
+
+        h, w = hef_gdir.get_inversion_flowline_hw()
+        mb_mod = massbalance.PastMassBalance(hef_gdir)
+        yrs = np.arange(1851, 2001)
+
+        mb = mb_mod.get_annual_mb_multiyear(h, yrs)
+        assert mb.shape == (len(h), len(yrs))
+        for i, yr in enumerate(yrs):
+            assert_allclose(mb[:, i], mb_mod.get_annual_mb(h, yr))
+
+        smb = mb_mod.get_specific_mb(h, w, year=yrs)
+        assert_allclose(smb, [mb_mod.get_specific_mb(h, w, year=yr)
+                              for yr in yrs])
+
+        # The numexpr and pure numpy fallbacks
+        monkeypatch.setattr(massbalance, '_have_numba', False)
+        assert_allclose(mb_mod.get_annual_mb_multiyear(h, yrs), mb)
+        monkeypatch.setattr(massbalance, '_have_numexpr', False)
+        assert_allclose(mb_mod.get_annual_mb_multiyear(h, yrs), mb)
+
+        with pytest.raises(ValueError):
+            mb_mod.get_annual_mb_multiyear(h, [1700, 1900])
+
+    def test_past_mb_batch(self, hef_gdir):
+
+        h, w = hef_gdir.get_inversion_flowline_hw()
+        mb_mod = massbalance.PastMassBalance(hef_gdir)
+        yrs = np.arange(1851, 2001)
+        hs = [h + dh for dh in np.linspace(-100, 100, len(yrs))]
+
+        mbs = mb_mod.get_annual_mb_batch(hs, yrs, max_workers=4)
+        assert len(mbs) == len(yrs)
+        for _h, yr, mb in zip(hs, yrs, mbs):
+            assert_allclose(mb, mb_mod.get_annual_mb(_h, yr))
+
+        with pytest.raises(ValueError):
+            mb_mod.get_annual_mb_batch(hs, yrs[:-1])
+
     def test_repr(self, hef_gdir):
         from textwrap import dedent
 
@@ -430,6 +510,16 @@ class TestMassBalanceModels:
         assert mb_mod._temp_bias == temp_bias_old
         assert_allclose(mb_mod.temp, temp_old)
 
+        # the biases are not applied cumulatively: no drift of the
+        # series when they are changed many times
+        for tb, pf in zip(np.linspace(-3, 3, 1000), np.linspace(1, 5, 1000)):
+            mb_mod.temp_bias = tb
+            mb_mod.prcp_fac = pf
+        mb_mod.temp_bias = temp_bias_old
+        mb_mod.prcp_fac = prcp_fac_old
+        np.testing.assert_array_equal(mb_mod.temp, temp_old)
+        np.testing.assert_array_equal(mb_mod.prcp, prcp_old)
+
         # check if error occurs for invalid prcp_fac
         with pytest.raises(InvalidParamsError):
             mb_mod.prcp_fac = -100
@@ -626,6 +716,37 @@ class TestMassBalanceModels:
         # not perfect because of time/months/zinterp issues
         np.testing.assert_allclose(mb, 0, atol=0.12)
 
+        # Lookup tables are recycled when going back to a previous bias
+        mb_ref = cmb_mod.get_annual_mb(h)
+        cmb_mod.temp_bias = 0.5
+        mb_biased = cmb_mod.get_annual_mb(h)
+        assert np.all(mb_biased < mb_ref)
+        cmb_mod.temp_bias = 0
+        assert len(cmb_mod._interp) == 2
+        assert_allclose(cmb_mod.get_annual_mb(h), mb_ref)
+        cmb_mod.temp_bias = 0.5 + cmb_mod._bias_resolution / 10
+        assert_allclose(cmb_mod.get_annual_mb(h), mb_biased)
+        assert len(cmb_mod._interp) == 2
+
+        # The residual bias is applied to the recycled tables as well
+        mb_m = cmb_mod.get_monthly_mb(h, year=0.5)
+        cmb_mod.bias = 500
+        assert_allclose(cmb_mod.get_annual_mb(h),
+                        mb_biased - 500 / (SEC_IN_YEAR * cmb_mod.rho))
+        assert_allclose(cmb_mod.get_monthly_mb(h, year=0.5),
+                        mb_m - 500 / (SEC_IN_YEAR * cmb_mod.rho))
+        cmb_mod.temp_bias = 0
+        assert_allclose(cmb_mod.get_annual_mb(h),
+                        mb_ref - 500 / (SEC_IN_YEAR * cmb_mod.rho))
+        cmb_mod.bias = 0
+        assert_allclose(cmb_mod.get_annual_mb(h), mb_ref)
+
+        # Only the last tables are kept
+        for tb in np.linspace(-1, 1, 2 * cmb_mod._interp_maxsize):
+            cmb_mod.temp_bias = tb
+            cmb_mod.get_annual_mb(h)
+        assert len(cmb_mod._interp) == cmb_mod._interp_maxsize
+
     def test_random_mb(self, hef_gdir):
 
         gdir = hef_gdir
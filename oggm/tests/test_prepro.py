@@ -1217,6 +1217,10 @@ class TestClimate(unittest.TestCase):
             self.assertTrue(ref_h == nc_r.ref_hgt)
             np.testing.assert_allclose(ref_t, nc_r.variables['temp'][:])
             np.testing.assert_allclose(ref_p, nc_r.variables['prcp'][:])
+            # The series are stored in a single chunk
+            nt = len(nc_r.dimensions['time'])
+            for v in ['time', 'temp', 'prcp']:
+                assert nc_r.variables[v].chunking() == [nt]
 
     @pytest.mark.slow
     def test_distribute_climate_grad(self):
@@ -1239,6 +1243,9 @@ class TestClimate(unittest.TestCase):
                 assert np.std(grad) > 0.0001
             except TypeError:
                 pass
+        with utils.ncDataset(gdir.get_filepath('climate_historical')) as nc:
+            nt = len(nc.dimensions['time'])
+            assert nc.variables['gradient'].chunking() == [nt]
         cfg.PARAMS['temp_use_local_gradient'] = False
 
     def test_distribute_climate_parallel(self):
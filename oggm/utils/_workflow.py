@@ -2825,6 +2825,9 @@ class GlacierDirectory(object):
             raise InvalidParamsError('`source` kwarg is required')
 
         zlib = cfg.PARAMS['compress_climate_netcdf']
+        # The MB models always read the full time series: store them in a
+        # single chunk (the default for unlimited dims is 1024 values)
+        chunksizes = (len(time),)
 
         try:
             y0 = time[0].year
@@ -2867,7 +2870,8 @@ class GlacierDirectory(object):
             nc.author = 'OGGM'
             nc.author_info = 'Open Global Glacier Model'
 
-            timev = nc.createVariable('time', 'i4', ('time',))
+            timev = nc.createVariable('time', 'i4', ('time',),
+                                      chunksizes=chunksizes)
 
             tatts = {'units': time_unit}
             if calendar is None:
@@ -2885,26 +2889,30 @@ class GlacierDirectory(object):
             timev.setncatts(tatts)
             timev[:] = numdate
 
-            v = nc.createVariable('prcp', 'f4', ('time',), zlib=zlib)
+            v = nc.createVariable('prcp', 'f4', ('time',), zlib=zlib,
+                                  chunksizes=chunksizes)
             v.units = 'kg m-2'
             v.long_name = 'total monthly precipitation amount'
 
             v[:] = prcp
 
-            v = nc.createVariable('temp', 'f4', ('time',), zlib=zlib)
+            v = nc.createVariable('temp', 'f4', ('time',), zlib=zlib,
+                                  chunksizes=chunksizes)
             v.units = 'degC'
             v.long_name = '2m temperature at height ref_hgt'
             v[:] = temp
 
             if gradient is not None:
-                v = nc.createVariable('gradient', 'f4', ('time',), zlib=zlib)
+                v = nc.createVariable('gradient', 'f4', ('time',), zlib=zlib,
+                                      chunksizes=chunksizes)
                 v.units = 'degC m-1'
                 v.long_name = ('temperature gradient from local regression or'
                                'lapserates')
                 v[:] = gradient
 
             if temp_std is not None:
-                v = nc.createVariable('temp_std', 'f4', ('time',), zlib=zlib)
+                v = nc.createVariable('temp_std', 'f4', ('time',), zlib=zlib,
+                                      chunksizes=chunksizes)
                 v.units = 'degC'
                 v.long_name = 'standard deviation of daily temperatures'
                 v[:] = temp_std